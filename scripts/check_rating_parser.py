@@ -0,0 +1,89 @@
+"""
+Check that parse_rating_output gives the same results under re and RE2.
+
+src/rating/fabric.py compiles its parsing patterns with google-re2 when
+it's installed and falls back to re otherwise. This parses sample
+outputs (built-in ones, plus any captured outputs given) with both
+engines and fails on any difference or error. Needs google-re2.
+
+Usage:
+    python scripts/check_rating_parser.py
+    python scripts/check_rating_parser.py outputs/
+"""
+
+import importlib
+import sys
+from pathlib import Path
+
+import click
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.rating import fabric  # noqa: E402
+
+
+# Both output formats, with and without an explanation, plus a miss
+_SAMPLES = [
+    b"RATING:\n\nB Tier: (Consume Original When Time Allows)\n\n"
+    b"Explanation:\n- Clear walkthrough\n- Good examples\n\nCONTENT SCORE:\n\n70",
+    b"RATING:\n\nS Tier: (Must Consume Original Content Immediately)\n",
+    b"RATING: A\n\nExplanation:\n- Dense and current\n",
+    b"RATING:\nD\n",
+    b"No rating here, just an error from the model.",
+]
+
+
+def _parse_all(outputs: list[bytes]) -> list:
+    """(rating, reasoning) per output, or the error message on failure."""
+    results = []
+    for output in outputs:
+        try:
+            result = fabric.parse_rating_output(output)
+            results.append((result.rating.value, result.reasoning))
+        except Exception as e:
+            # Not just ValueError: an engine mismatch can raise anything
+            results.append(f"{type(e).__name__}: {e}")
+    return results
+
+
+def _reload_fabric(use_re2: bool) -> str:
+    """Re-import src.rating.fabric with or without RE2; return the engine name."""
+    if use_re2:
+        sys.modules.pop("re2", None)
+    else:
+        sys.modules["re2"] = None  # Makes "import re2" raise ImportError
+
+    importlib.reload(fabric)
+    return fabric.re_engine.__name__
+
+
+@click.command()
+@click.argument("outputs_dir", required=False,
+                type=click.Path(exists=True, file_okay=False, path_type=Path))
+def main(outputs_dir: Path | None):
+    """Parse sample outputs with re and RE2 and compare the results."""
+    outputs = list(_SAMPLES)
+    if outputs_dir is not None:
+        outputs += [path.read_bytes() for path in sorted(outputs_dir.iterdir()) if path.is_file()]
+
+    if _reload_fabric(use_re2=True) != "re2":
+        raise click.ClickException("google-re2 is not installed")
+    with_re2 = _parse_all(outputs)
+
+    _reload_fabric(use_re2=False)
+    with_re = _parse_all(outputs)
+
+    mismatches = [
+        (output, a, b) for output, a, b in zip(outputs, with_re, with_re2) if a != b
+    ]
+    for output, a, b in mismatches:
+        click.echo(f"Mismatch on {output[:60]!r}...\n  re:  {a}\n  re2: {b}")
+
+    if mismatches:
+        raise click.ClickException(f"{len(mismatches)}/{len(outputs)} outputs differ")
+
+    click.echo(f"OK: {len(outputs)} outputs parse identically under re and re2")
+
+
+if __name__ == "__main__":
+    main()
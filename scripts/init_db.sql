@@ -12,8 +12,8 @@ CREATE TABLE IF NOT EXISTS sources (
     type TEXT NOT NULL,                -- "youtube" | "podcast" | "rss"
     url TEXT NOT NULL UNIQUE,          -- Channel/feed URL
     enabled INTEGER DEFAULT 1,         -- 1=active, 0=paused
-    last_fetch_at TEXT,                -- ISO timestamp of last fetch
-    created_at TEXT DEFAULT (datetime('now'))
+    last_fetch_at TIMESTAMP,           -- ISO timestamp of last fetch
+    created_at TIMESTAMP DEFAULT (datetime('now'))
 );
 
 -- ============================================
@@ -30,20 +30,23 @@ CREATE TABLE IF NOT EXISTS content_items (
     url TEXT NOT NULL UNIQUE,          -- Unique constraint prevents duplicates
     description TEXT,
     transcript TEXT,                   -- For YouTube videos (from captions)
-    published_date TEXT,               -- When the content was published
+    published_date TIMESTAMP,          -- When the content was published
     duration_minutes INTEGER,          -- Video/episode length
 
     -- Rating data (filled by Fabric)
     rating TEXT,                       -- NULL | "S" | "A" | "B" | "C" | "D"
     rating_reasoning TEXT,             -- Why Fabric gave this rating
-    rated_at TEXT,                     -- When we rated it
+    rated_at TIMESTAMP,                -- When we rated it
 
     -- Output tracking
     published_to_obsidian INTEGER DEFAULT 0,  -- 1 = included in digest
     digest_id INTEGER,                 -- Which digest included this item
 
     -- Timestamps
-    fetched_at TEXT DEFAULT (datetime('now')),
+    fetched_at TIMESTAMP DEFAULT (datetime('now')),
+
+    -- Dedup beyond URL: SHA-256 of normalized title/description/transcript
+    content_fingerprint TEXT,
 
     FOREIGN KEY (source_id) REFERENCES sources(id)
 );
@@ -54,13 +57,13 @@ CREATE TABLE IF NOT EXISTS content_items (
 -- ============================================
 CREATE TABLE IF NOT EXISTS digests (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
-    week_start_date TEXT NOT NULL,
-    week_end_date TEXT NOT NULL,
+    week_start_date TIMESTAMP NOT NULL,
+    week_end_date TIMESTAMP NOT NULL,
     item_count INTEGER,
     s_tier_count INTEGER,
     a_tier_count INTEGER,
     obsidian_path TEXT,                -- Where we saved the digest file
-    created_at TEXT DEFAULT (datetime('now'))
+    created_at TIMESTAMP DEFAULT (datetime('now'))
 );
 
 -- ============================================
@@ -74,8 +77,8 @@ CREATE TABLE IF NOT EXISTS fetch_logs (
     items_fetched INTEGER,
     success INTEGER,                   -- 1=success, 0=failure
     error_message TEXT,
-    started_at TEXT,
-    completed_at TEXT,
+    started_at TIMESTAMP,
+    completed_at TIMESTAMP,
 
     FOREIGN KEY (source_id) REFERENCES sources(id)
 );
@@ -85,10 +88,25 @@ CREATE TABLE IF NOT EXISTS fetch_logs (
 -- Speed up common queries
 -- ============================================
 CREATE INDEX IF NOT EXISTS idx_content_url ON content_items(url);
-CREATE INDEX IF NOT EXISTS idx_content_rating ON content_items(rating);
 CREATE INDEX IF NOT EXISTS idx_content_published ON content_items(published_to_obsidian);
 CREATE INDEX IF NOT EXISTS idx_content_date ON content_items(published_date);
 CREATE INDEX IF NOT EXISTS idx_content_source ON content_items(source_id);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_content_fingerprint ON content_items(content_fingerprint);
+
+-- Partial indexes matching the hot query predicates exactly
+-- (url lookups already use the UNIQUE constraint's index)
+CREATE INDEX IF NOT EXISTS idx_items_unrated
+    ON content_items(fetched_at DESC) WHERE rating IS NULL;
+-- Column order matches ORDER BY rating DESC, published_date DESC,
+-- so the digest query walks the index with no sort step
+CREATE INDEX IF NOT EXISTS idx_items_rating_date
+    ON content_items(rating DESC, published_date DESC)
+    WHERE rating IN ('A', 'S') AND published_to_obsidian = 0;
+DROP INDEX IF EXISTS idx_items_top_unpub;  -- Superseded by idx_items_rating_date
+-- Without ANALYZE stats the planner preferred this for rating IS NULL
+-- and then sorted; idx_items_unrated and idx_items_rating_date cover
+-- the rating lookups, and get_stats scans the table anyway
+DROP INDEX IF EXISTS idx_content_rating;
 
 -- ============================================
 -- Enable WAL mode for better concurrency
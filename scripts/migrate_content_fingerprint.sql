@@ -0,0 +1,21 @@
+-- Bring an existing database up to the current init_db.sql schema
+-- Run once with: sqlite3 curation.db < scripts/migrate_content_fingerprint.sql
+-- (new databases created from init_db.sql already have all of this).
+-- Run it before re-running init_db.sql on an old database: init_db.sql
+-- indexes content_fingerprint, which fails until the column exists.
+
+-- SHA-256 of normalized title/description/transcript, filled on insert
+-- (NULL for items with no description or transcript).
+-- Existing rows stay NULL; UNIQUE allows any number of NULLs.
+ALTER TABLE content_items ADD COLUMN content_fingerprint TEXT;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_content_fingerprint ON content_items(content_fingerprint);
+
+-- Partial indexes added alongside it in init_db.sql
+CREATE INDEX IF NOT EXISTS idx_items_unrated
+    ON content_items(fetched_at DESC) WHERE rating IS NULL;
+CREATE INDEX IF NOT EXISTS idx_items_rating_date
+    ON content_items(rating DESC, published_date DESC)
+    WHERE rating IN ('A', 'S') AND published_to_obsidian = 0;
+DROP INDEX IF EXISTS idx_items_top_unpub;
+DROP INDEX IF EXISTS idx_content_rating;  -- Shadowed idx_items_unrated (see init_db.sql)
@@ -0,0 +1,126 @@
+"""
+Profile which fragments of the rating regexes real Fabric output needs.
+
+For each fragment of the patterns in src/rating/fabric.py, the fragment
+is replaced (with the never-matching "foobar123", or with a tighter
+literal) and the patched pattern is run over captured Fabric outputs.
+A fragment whose replacement changes no outcomes isn't pulling its
+weight on real data: it can be removed or tightened. The search time of
+each variant is reported too.
+
+Outputs are plain files holding one raw rate_content response each, e.g.
+captured with:
+
+    fabric --pattern rate_content < input.txt > outputs/item-001.txt
+
+Collect 200+ before drawing conclusions - a fragment that never fires
+on a small sample may still be needed for rarer model responses.
+
+Usage:
+    python scripts/profile_rating_regex.py outputs/
+    python scripts/profile_rating_regex.py outputs/ --repeat 50
+"""
+
+import sys
+import timeit
+from pathlib import Path
+
+import click
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.rating.fabric import _RATING_LETTER_RE, _TIER_DESCRIPTION_RE, re_engine  # noqa: E402
+
+
+# Stand-in for a removed fragment; never occurs in Fabric output
+_NEVER_MATCHES = b"foobar123"
+
+# Pattern name -> (compiled pattern, what the parser takes from a match,
+# [(label, fragment, replacement)]). Fragments are bytes substrings of
+# the pattern source
+_VARIANTS = {
+    "rating letter": (
+        _RATING_LETTER_RE,
+        lambda m: m.group(1) or m.group(2),
+        [
+            ('"X Tier:" branch', rb"([SABCD])\s+Tier:", rb"(" + _NEVER_MATCHES + rb")"),
+            ('"RATING: X" branch', rb"RATING:\s*([SABCD])", rb"(" + _NEVER_MATCHES + rb")"),
+            (r'\s+ -> " "', rb"[SABCD])\s+Tier:", rb"[SABCD]) Tier:"),
+            (r'\s* -> ""', rb"RATING:\s*", rb"RATING:"),
+            (r'\s* -> " "', rb"RATING:\s*", rb"RATING: "),
+        ],
+    ),
+    "tier description": (
+        _TIER_DESCRIPTION_RE,
+        lambda m: m.group(1),
+        [
+            ("whole pattern", _TIER_DESCRIPTION_RE.pattern, _NEVER_MATCHES + rb"()"),
+            (r'\s* -> " "', rb"Tier:\s*\(", rb"Tier: \("),
+            (r'\s* -> ""', rb"Tier:\s*\(", rb"Tier:\("),
+        ],
+    ),
+}
+
+
+def _outcomes(pattern, extract, outputs: list[bytes]) -> list:
+    """What the parser would take from each output (None for no match)."""
+    outcomes = []
+    for output in outputs:
+        match = pattern.search(output)
+        outcomes.append(extract(match) if match else None)
+    return outcomes
+
+
+def _search_seconds(pattern, outputs: list[bytes], repeat: int) -> float:
+    """Best-of-3 time to search every output `repeat` times."""
+    search = pattern.search
+
+    def run():
+        for output in outputs:
+            search(output)
+
+    return min(timeit.repeat(run, number=repeat, repeat=3))
+
+
+@click.command()
+@click.argument("outputs_dir", type=click.Path(exists=True, file_okay=False, path_type=Path))
+@click.option("--repeat", default=20, show_default=True, help="Timing passes over all outputs")
+def main(outputs_dir: Path, repeat: int):
+    """Report how each regex fragment affects matches on captured outputs."""
+    outputs = [path.read_bytes() for path in sorted(outputs_dir.iterdir()) if path.is_file()]
+    if not outputs:
+        raise click.ClickException(f"No output files in {outputs_dir}")
+
+    click.echo(f"{len(outputs)} captured outputs, {repeat} timing passes\n")
+
+    for name, (pattern, extract, variants) in _VARIANTS.items():
+        baseline = _outcomes(pattern, extract, outputs)
+        matched = sum(outcome is not None for outcome in baseline)
+        base_time = _search_seconds(pattern, outputs, repeat)
+
+        click.echo(f"{name}: {pattern.pattern.decode()}")
+        click.echo(f"  baseline: {matched}/{len(outputs)} matched, {base_time * 1000:.2f} ms")
+
+        for label, fragment, replacement in variants:
+            if fragment not in pattern.pattern:
+                click.echo(f"  {label:20} skipped (fragment no longer in pattern)")
+                continue
+
+            # Same engine as the parser (RE2 when installed)
+            variant = re_engine.compile(pattern.pattern.replace(fragment, replacement, 1))
+            changed = sum(
+                a != b for a, b in zip(baseline, _outcomes(variant, extract, outputs))
+            )
+            variant_time = _search_seconds(variant, outputs, repeat)
+
+            verdict = "not needed on this data" if changed == 0 else "needed"
+            click.echo(
+                f"  {label:20} {changed:5} changed ({changed / len(outputs):6.1%}), "
+                f"{variant_time * 1000:8.2f} ms  {verdict}"
+            )
+
+        click.echo()
+
+
+if __name__ == "__main__":
+    main()
@@ -12,8 +12,9 @@ Usage:
 import click
 from datetime import datetime
 
-from . import db
-from .models import SourceType
+# Project modules (db, models, fetchers, ...) and heavier stdlib modules
+# are imported inside each command so `--help` and light commands don't
+# pay for them
 
 
 @click.group()
@@ -27,7 +28,16 @@ def cli():
 @click.option("--all", "fetch_all", is_flag=True, help="Fetch from all enabled sources")
 @click.option("--type", "source_type", type=click.Choice(["youtube", "podcast", "rss"]),
               help="Fetch only sources of this type")
-def fetch(source_name: str | None, fetch_all: bool, source_type: str | None):
+@click.option("--workers", default=4, show_default=True,
+              help="Number of sources to fetch in parallel")
+@click.option("-v", "--verbose", count=True, help="Show per-video fetch details")
+def fetch(
+    source_name: str | None,
+    fetch_all: bool,
+    source_type: str | None,
+    workers: int,
+    verbose: int,
+):
     """
     Fetch content from sources.
 
@@ -35,76 +45,113 @@ def fetch(source_name: str | None, fetch_all: bool, source_type: str | None):
         python -m src.cli fetch ThePrimeagen
         python -m src.cli fetch --all
         python -m src.cli fetch --type youtube
+        python -m src.cli fetch --all --workers 8
+        python -m src.cli fetch ThePrimeagen -v
     """
-    sources = db.get_sources(enabled_only=True)
+    from . import db
+    from .models import SourceType
+
+    # One connection for the whole command instead of one per query
+    with db.get_connection() as conn:
+        sources = db.get_sources(enabled_only=True, conn=conn)
+
+        if source_name:
+            # Fetch single source by name
+            source = db.get_source_by_name(source_name, conn=conn)
+            if not source:
+                click.echo(f"Source '{source_name}' not found", err=True)
+                return
+            sources = [source]
+
+        elif source_type:
+            # Filter by type
+            sources = [s for s in sources if s.type.value == source_type]
+
+        elif not fetch_all:
+            click.echo("Specify a source name, --all, or --type", err=True)
+            return
 
-    if source_name:
-        # Fetch single source by name
-        source = db.get_source_by_name(source_name)
-        if not source:
-            click.echo(f"Source '{source_name}' not found", err=True)
+        if not sources:
+            click.echo("No sources to fetch")
             return
-        sources = [source]
 
-    elif source_type:
-        # Filter by type
-        sources = [s for s in sources if s.type.value == source_type]
+        click.echo(f"Fetching from {len(sources)} source(s)...\n")
 
-    elif not fetch_all:
-        click.echo("Specify a source name, --all, or --type", err=True)
-        return
+        total_new = 0
+        total_skipped = 0
 
-    if not sources:
-        click.echo("No sources to fetch")
-        return
+        fetchable = []
+        for source in sources:
+            if source.type == SourceType.YOUTUBE:
+                fetchable.append(source)
 
-    click.echo(f"Fetching from {len(sources)} source(s)...\n")
+            elif source.type == SourceType.PODCAST:
+                # TODO: Implement podcast fetcher
+                click.echo(f"[{source.type.value}] {source.name}")
+                click.echo("  -> Podcast fetcher not implemented yet")
 
-    total_new = 0
-    total_skipped = 0
+            elif source.type == SourceType.RSS:
+                # TODO: Implement RSS fetcher
+                click.echo(f"[{source.type.value}] {source.name}")
+                click.echo("  -> RSS fetcher not implemented yet")
 
-    for source in sources:
-        click.echo(f"[{source.type.value}] {source.name}")
+        # Per-source results are echoed after the progress bar finishes
+        # so they don't break its in-place redraw
+        report = []
 
-        if source.type == SourceType.YOUTUBE:
+        # Only import yt-dlp when there's something for it to fetch
+        if fetchable:
+            from concurrent.futures import ThreadPoolExecutor, as_completed
             from .fetchers.youtube import fetch_channel_videos
-            items = fetch_channel_videos(source.url, source.id)
 
-        elif source.type == SourceType.PODCAST:
-            # TODO: Implement podcast fetcher
-            click.echo("  -> Podcast fetcher not implemented yet")
-            continue
+            # Fetching is network-bound, so run sources in parallel threads;
+            # database writes stay on this thread as each source finishes
+            with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+                futures = {
+                    executor.submit(
+                        fetch_channel_videos, source.url, source.id, verbose=verbose > 0
+                    ): source
+                    for source in fetchable
+                }
 
-        elif source.type == SourceType.RSS:
-            # TODO: Implement RSS fetcher
-            click.echo("  -> RSS fetcher not implemented yet")
-            continue
+                progress = click.progressbar(
+                    as_completed(futures), length=len(futures), label="Fetching"
+                )
 
-        new_count = 0
-        skip_count = 0
+                with progress as completed:
+                    for future in completed:
+                        source = futures[future]
+                        report.append(f"[{source.type.value}] {source.name}")
 
-        for item in items:
-            if db.content_exists(item.url):
-                skip_count += 1
-                continue
+                        try:
+                            items = future.result()
+                        except Exception as e:
+                            report.append(f"  -> Error fetching: {e}")
+                            db.log_fetch(
+                                source.id, 0, success=False, error_message=str(e), conn=conn
+                            )
+                            conn.commit()
+                            continue
 
-            try:
-                db.insert_content_item(item)
-                new_count += 1
-            except Exception as e:
-                click.echo(f"  -> Error inserting: {e}")
+                        # Duplicates are rejected by the UNIQUE(url) constraint
+                        # instead of being checked up front
+                        new_count = db.insert_content_items_bulk(items, conn=conn)
+                        db.update_source_last_fetch(source.id, conn=conn)
+                        db.log_fetch(source.id, new_count, success=True, conn=conn)
+
+                        # One transaction per source
+                        conn.commit()
 
-        # Update last fetch timestamp
-        db.update_source_last_fetch(source.id)
+                        skip_count = len(items) - new_count
 
-        # Log the fetch
-        db.log_fetch(source.id, new_count, success=True)
+                        report.append(f"  -> {new_count} new, {skip_count} skipped (duplicates)")
+                        total_new += new_count
+                        total_skipped += skip_count
 
-        click.echo(f"  -> {new_count} new, {skip_count} skipped (duplicates)")
-        total_new += new_count
-        total_skipped += skip_count
+        for line in report:
+            click.echo(line)
 
-    click.echo(f"\nTotal: {total_new} new items, {total_skipped} duplicates skipped")
+        click.echo(f"\nTotal: {total_new} new items, {total_skipped} duplicates skipped")
 
 
 @cli.command()
@@ -117,7 +164,8 @@ def rate(limit: int):
         python -m src.cli rate
         python -m src.cli rate --limit 5
     """
-    from .rating.fabric import rate_content_item
+    from . import db
+    from .rating.fabric import rate_batch
 
     items = db.get_unrated_items(limit=limit)
 
@@ -127,15 +175,26 @@ def rate(limit: int):
 
     click.echo(f"Rating {len(items)} item(s)...\n")
 
-    for item in items:
-        click.echo(f"Rating: {item.title[:60]}...")
+    with db.get_connection() as conn:
+        def save_result(item, result):
+            click.echo(f"Rating: {item.title[:60]}...")
+
+            if isinstance(result, Exception):
+                click.echo(f"  -> Error: {result}")
+                return
 
-        try:
-            result = rate_content_item(item)
-            db.update_rating(item.id, result.rating, result.reasoning)
-            click.echo(f"  -> {result.rating.value}: {result.reasoning[:80]}...")
-        except Exception as e:
-            click.echo(f"  -> Error: {e}")
+            try:
+                db.update_rating(item.id, result.rating, result.reasoning, conn=conn)
+                # Commit each rating as it arrives, so an interrupted batch
+                # keeps everything already rated
+                conn.commit()
+                click.echo(f"  -> {result.rating.value}: {result.reasoning[:80]}...")
+            except Exception as e:
+                click.echo(f"  -> Error: {e}")
+
+        # Items are rated concurrently (fabric.batch_size at a time) and
+        # saved as each one finishes
+        rate_batch(items, on_result=save_result)
 
 
 @cli.command()
@@ -145,8 +204,10 @@ def digest():
 
     Creates a markdown file with A/S-tier content.
     """
+    from . import db
     from .digest.generator import generate_digest
     from .digest.writer import write_to_obsidian
+    from .models import Digest
 
     items = db.get_unpublished_top_tier(days=7)
 
@@ -167,7 +228,6 @@ def digest():
     s_count = sum(1 for i in items if i.rating.value == "S")
     a_count = sum(1 for i in items if i.rating.value == "A")
 
-    from .models import Digest
     digest_record = Digest(
         week_start_date=datetime.now(),
         week_end_date=datetime.now(),
@@ -188,6 +248,8 @@ def digest():
 @cli.command()
 def stats():
     """Show database statistics."""
+    from . import db
+
     statistics = db.get_stats()
 
     click.echo("Content Curation Statistics")
@@ -205,6 +267,8 @@ def stats():
 @cli.command()
 def sources():
     """List all configured sources."""
+    from . import db
+
     all_sources = db.get_sources(enabled_only=False)
 
     click.echo("Configured Sources")
@@ -5,14 +5,16 @@ Loads settings from config/settings.yaml and provides
 typed access to configuration values.
 """
 
+import os
+import pickle
 from pathlib import Path
-from dataclasses import dataclass
-import yaml
+from dataclasses import dataclass, field
 
 
 @dataclass
 class DatabaseConfig:
     path: str
+    synchronous: str = "NORMAL"  # SQLite PRAGMA synchronous (OFF/NORMAL/FULL/EXTRA)
 
 
 @dataclass
@@ -30,6 +32,38 @@ class FabricConfig:
     model: str
     pattern: str
     batch_size: int
+    backend: str = "subprocess"  # "subprocess" (Fabric CLI) or "http" (direct API calls)
+    api_base: str = "https://api.openai.com/v1"  # OpenAI-compatible API for the http backend
+    api_key_env: str = "OPENAI_API_KEY"  # Environment variable holding the API key
+    patterns_dir: str = "~/.config/fabric/patterns"  # Where Fabric keeps its patterns
+    prefilter: dict[str, list[str]] = field(default_factory=dict)  # Rating -> title keywords
+
+    def __post_init__(self):
+        # Checked here so a config slip fails once at load instead of
+        # silently misrating items (a bare string would be iterated as
+        # one-letter keywords)
+        prefilter = self.prefilter or {}  # An empty "prefilter:" loads as None
+        if not isinstance(prefilter, dict):
+            raise ValueError(
+                "fabric.prefilter must map a rating (S/A/B/C/D) to a list of keywords"
+            )
+
+        normalized = {}
+        for rating, keywords in prefilter.items():
+            letter = str(rating).upper()
+            if letter not in ("S", "A", "B", "C", "D"):
+                raise ValueError(
+                    f"fabric.prefilter: unknown rating {rating!r} (expected S, A, B, C or D)"
+                )
+            if not isinstance(keywords, list) or not all(
+                isinstance(keyword, str) and keyword.strip() for keyword in keywords
+            ):
+                raise ValueError(
+                    f"fabric.prefilter.{rating}: expected a list of keywords, got {keywords!r}"
+                )
+            normalized.setdefault(letter, []).extend(keywords)
+
+        self.prefilter = normalized
 
 
 @dataclass
@@ -50,6 +84,9 @@ def load_settings(config_path: Path | None = None) -> Settings:
     """
     Load settings from YAML config file.
 
+    The parsed result is pickled to a hidden ".<name>.cache" file next to
+    the YAML file and reused until the YAML file changes.
+
     Args:
         config_path: Path to settings.yaml. If None, uses default location.
 
@@ -59,16 +96,62 @@ def load_settings(config_path: Path | None = None) -> Settings:
     if config_path is None:
         # Default: config/settings.yaml relative to this file's parent
         config_path = Path(__file__).parent.parent / "config" / "settings.yaml"
+    config_path = Path(config_path)
+
+    # Every CLI command is a fresh process, so reuse the last parse
+    # whenever neither the YAML file nor this module has changed
+    cache_path = config_path.with_name(f".{config_path.name}.cache")
+    cache_key = _cache_key(config_path)
+
+    cached = _read_cache(cache_path, cache_key)
+    if cached is not None:
+        return cached
+
+    # Imported here so cache hits never load PyYAML
+    import yaml
 
     with open(config_path) as f:
         raw = yaml.safe_load(f)
 
-    return Settings(
+    settings = Settings(
         database=DatabaseConfig(**raw["database"]),
         obsidian=ObsidianConfig(**raw["obsidian"]),
         fabric=FabricConfig(**raw["fabric"]),
         fetch=FetchConfig(**raw["fetch"]),
     )
+    _write_cache(cache_path, cache_key, settings)
+    return settings
+
+
+def _cache_key(config_path: Path) -> tuple:
+    """Identify a settings file version by its mtime/size (and this module's mtime)."""
+    config_stat = os.stat(config_path)
+    module_stat = os.stat(__file__)
+    return (config_stat.st_mtime_ns, config_stat.st_size, module_stat.st_mtime_ns)
+
+
+def _read_cache(cache_path: Path, cache_key: tuple) -> Settings | None:
+    """Return cached Settings if the cache matches cache_key, else None."""
+    try:
+        with open(cache_path, "rb") as f:
+            key, settings = pickle.load(f)
+    except Exception:
+        # Missing, corrupt, or written by an incompatible version
+        return None
+
+    if key != cache_key or not isinstance(settings, Settings):
+        return None
+    return settings
+
+
+def _write_cache(cache_path: Path, cache_key: tuple, settings: Settings) -> None:
+    """Store parsed Settings next to the YAML file (best effort)."""
+    try:
+        with open(cache_path, "wb") as f:
+            pickle.dump((cache_key, settings), f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        # Read-only config directory - just parse YAML every time
+        pass
 
 
 # Singleton instance - load once, use everywhere
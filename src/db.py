@@ -4,17 +4,46 @@ Database operations for Content Curation System.
 All SQLite interactions go through this module.
 """
 
+import functools
+import hashlib
+import re
 import sqlite3
 from datetime import datetime
 from pathlib import Path
-from contextlib import contextmanager
+from contextlib import contextmanager, nullcontext
 
 from .models import Source, ContentItem, SourceType, Rating, Digest
 from .config import get_settings
 
 
+# TIMESTAMP columns hold ISO-8601 text; with detect_types=PARSE_DECLTYPES
+# sqlite3 hands them back as datetime objects (NULLs stay None)
+sqlite3.register_converter(
+    "TIMESTAMP", lambda value: datetime.fromisoformat(value.decode())
+)
+
+# Collapses whitespace runs when fingerprinting content
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Rating lookup without going through the Enum call machinery
+_RATINGS_BY_VALUE = {rating.value: rating for rating in Rating}
+
+# Max values per IN (...) list - keeps statements well under SQLite's
+# host parameter limit (999 on older builds)
+_IN_LIST_BATCH_SIZE = 500
+
+# Allowed values for settings.database.synchronous
+_SYNCHRONOUS_MODES = {"OFF", "NORMAL", "FULL", "EXTRA"}
+
+
+@functools.lru_cache(maxsize=1)
 def get_db_path() -> Path:
-    """Get the database path from settings."""
+    """
+    Get the database path from settings.
+
+    Cached: settings don't change within a process, and resolve() hits
+    the filesystem on every call.
+    """
     settings = get_settings()
     # Resolve relative to the project root (where we run from)
     return Path(settings.database.path).resolve()
@@ -25,12 +54,16 @@ def get_connection():
     """
     Context manager for database connections.
 
+    Every query helper below takes an optional conn so callers doing
+    many operations can share one connection (and one transaction).
+
     Usage:
         with get_connection() as conn:
             cursor = conn.execute("SELECT * FROM sources")
     """
-    conn = sqlite3.connect(get_db_path())
+    conn = sqlite3.connect(get_db_path(), detect_types=sqlite3.PARSE_DECLTYPES)
     conn.row_factory = sqlite3.Row  # Access columns by name
+    _configure_connection(conn)
     try:
         yield conn
         conn.commit()
@@ -38,13 +71,45 @@ def get_connection():
         conn.close()
 
 
+def _batched(values: list, size: int):
+    """Yield successive slices of at most size values."""
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+
+def _configure_connection(conn: sqlite3.Connection) -> None:
+    """Apply per-connection performance PRAGMAs."""
+    synchronous = get_settings().database.synchronous.upper()
+    if synchronous not in _SYNCHRONOUS_MODES:
+        raise ValueError(f"Invalid database.synchronous setting: {synchronous}")
+
+    conn.execute("PRAGMA journal_mode=WAL")  # Persistent; re-setting is a no-op
+    conn.execute(f"PRAGMA synchronous={synchronous}")
+    conn.execute("PRAGMA cache_size=-65536")  # 64 MB page cache
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA mmap_size=268435456")  # 256 MB memory-mapped reads
+
+
+def _use_connection(conn: sqlite3.Connection | None):
+    """
+    Reuse the caller's connection if given, otherwise open a new one.
+
+    A borrowed connection is not committed here - the caller's
+    get_connection() block commits it.
+    """
+    return nullcontext(conn) if conn is not None else get_connection()
+
+
 # ============================================
 # SOURCE OPERATIONS
 # ============================================
 
-def get_sources(enabled_only: bool = True) -> list[Source]:
+def get_sources(
+    enabled_only: bool = True,
+    conn: sqlite3.Connection | None = None,
+) -> list[Source]:
     """Get all content sources."""
-    with get_connection() as conn:
+    with _use_connection(conn) as conn:
         if enabled_only:
             cursor = conn.execute(
                 "SELECT * FROM sources WHERE enabled = 1"
@@ -59,16 +124,18 @@ def get_sources(enabled_only: bool = True) -> list[Source]:
                 type=SourceType(row["type"]),
                 url=row["url"],
                 enabled=bool(row["enabled"]),
-                last_fetch_at=datetime.fromisoformat(row["last_fetch_at"])
-                if row["last_fetch_at"] else None,
+                last_fetch_at=_to_datetime(row["last_fetch_at"]),
             )
             for row in cursor.fetchall()
         ]
 
 
-def get_source_by_name(name: str) -> Source | None:
+def get_source_by_name(
+    name: str,
+    conn: sqlite3.Connection | None = None,
+) -> Source | None:
     """Get a source by name."""
-    with get_connection() as conn:
+    with _use_connection(conn) as conn:
         cursor = conn.execute(
             "SELECT * FROM sources WHERE name = ?", (name,)
         )
@@ -82,14 +149,16 @@ def get_source_by_name(name: str) -> Source | None:
             type=SourceType(row["type"]),
             url=row["url"],
             enabled=bool(row["enabled"]),
-            last_fetch_at=datetime.fromisoformat(row["last_fetch_at"])
-            if row["last_fetch_at"] else None,
+            last_fetch_at=_to_datetime(row["last_fetch_at"]),
         )
 
 
-def update_source_last_fetch(source_id: int) -> None:
+def update_source_last_fetch(
+    source_id: int,
+    conn: sqlite3.Connection | None = None,
+) -> None:
     """Update the last_fetch_at timestamp for a source."""
-    with get_connection() as conn:
+    with _use_connection(conn) as conn:
         conn.execute(
             "UPDATE sources SET last_fetch_at = ? WHERE id = ?",
             (datetime.now().isoformat(), source_id),
@@ -100,47 +169,112 @@ def update_source_last_fetch(source_id: int) -> None:
 # CONTENT ITEM OPERATIONS
 # ============================================
 
-def content_exists(url: str) -> bool:
+def content_exists(url: str, conn: sqlite3.Connection | None = None) -> bool:
     """Check if a content item already exists (deduplication)."""
-    with get_connection() as conn:
+    with _use_connection(conn) as conn:
         cursor = conn.execute(
             "SELECT 1 FROM content_items WHERE url = ?", (url,)
         )
         return cursor.fetchone() is not None
 
 
-def insert_content_item(item: ContentItem) -> int:
+def insert_content_item(
+    item: ContentItem,
+    conn: sqlite3.Connection | None = None,
+) -> int | None:
     """
     Insert a new content item.
 
-    Returns the new item's ID.
-    Raises sqlite3.IntegrityError if URL already exists.
+    Returns the new item's ID, or None if the URL or content fingerprint
+    already exists (one statement instead of a content_exists() check
+    plus INSERT).
     """
-    with get_connection() as conn:
+    with _use_connection(conn) as conn:
         cursor = conn.execute(
+            """
+            INSERT OR IGNORE INTO content_items (
+                source_id, title, url, description, transcript,
+                published_date, duration_minutes, fetched_at,
+                content_fingerprint
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            RETURNING id
+            """,
+            _content_item_params(item),
+        )
+        row = cursor.fetchone()
+        return row["id"] if row else None
+
+
+def insert_content_items_bulk(
+    items: list[ContentItem],
+    conn: sqlite3.Connection | None = None,
+) -> int:
+    """
+    Insert many content items in a single transaction.
+
+    Items whose URL or content fingerprint already exists are skipped by
+    the UNIQUE constraints, so no separate existence check is needed.
+
+    Returns the number of newly inserted items.
+    """
+    if not items:
+        return 0
+
+    with _use_connection(conn) as conn:
+        cursor = conn.executemany(
             """
             INSERT INTO content_items (
                 source_id, title, url, description, transcript,
-                published_date, duration_minutes, fetched_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                published_date, duration_minutes, fetched_at,
+                content_fingerprint
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT DO NOTHING
             """,
-            (
-                item.source_id,
-                item.title,
-                item.url,
-                item.description,
-                item.transcript,
-                item.published_date.isoformat() if item.published_date else None,
-                item.duration_minutes,
-                datetime.now().isoformat(),
-            ),
+            [_content_item_params(item) for item in items],
         )
-        return cursor.lastrowid
+        return cursor.rowcount
+
+
+def _content_item_params(item: ContentItem) -> tuple:
+    """Build the INSERT parameters for a content item."""
+    return (
+        item.source_id,
+        item.title,
+        item.url,
+        item.description,
+        item.transcript,
+        item.published_date.isoformat() if item.published_date else None,
+        item.duration_minutes,
+        datetime.now().isoformat(),
+        _content_fingerprint(item),
+    )
+
+
+def _content_fingerprint(item: ContentItem) -> str | None:
+    """
+    SHA-256 of the item's normalized text (lowercased, whitespace collapsed).
 
+    Catches reposts/mirrors of the same content under a different URL, so
+    they are never stored (or sent to Fabric) twice. Items with no
+    description or transcript get None: a title alone ("Live Stream",
+    "Q&A") doesn't identify the content, and NULLs never collide.
+    """
+    if not (item.description or item.transcript):
+        return None
+
+    text = " ".join(
+        part for part in (item.title, item.description, item.transcript) if part
+    )
+    normalized = _WHITESPACE_RE.sub(" ", text.lower()).strip()
+    return hashlib.sha256(normalized.encode()).hexdigest()
 
-def get_unrated_items(limit: int = 10) -> list[ContentItem]:
+
+def get_unrated_items(
+    limit: int = 10,
+    conn: sqlite3.Connection | None = None,
+) -> list[ContentItem]:
     """Get content items that haven't been rated yet."""
-    with get_connection() as conn:
+    with _use_connection(conn) as conn:
         cursor = conn.execute(
             """
             SELECT * FROM content_items
@@ -153,9 +287,14 @@ def get_unrated_items(limit: int = 10) -> list[ContentItem]:
         return [_row_to_content_item(row) for row in cursor.fetchall()]
 
 
-def update_rating(item_id: int, rating: Rating, reasoning: str) -> None:
+def update_rating(
+    item_id: int,
+    rating: Rating,
+    reasoning: str,
+    conn: sqlite3.Connection | None = None,
+) -> None:
     """Update the rating for a content item."""
-    with get_connection() as conn:
+    with _use_connection(conn) as conn:
         conn.execute(
             """
             UPDATE content_items
@@ -166,62 +305,86 @@ def update_rating(item_id: int, rating: Rating, reasoning: str) -> None:
         )
 
 
-def get_unpublished_top_tier(days: int = 7) -> list[ContentItem]:
+def get_unpublished_top_tier(
+    days: int = 7,
+    conn: sqlite3.Connection | None = None,
+) -> list[ContentItem]:
     """
     Get A/S-tier items that haven't been published to Obsidian yet.
 
     Used for digest generation.
     """
-    with get_connection() as conn:
+    with _use_connection(conn) as conn:
         cursor = conn.execute(
             """
             SELECT * FROM content_items
             WHERE rating IN ('A', 'S')
             AND published_to_obsidian = 0
             AND fetched_at >= datetime('now', ?)
-            ORDER BY
-                CASE rating WHEN 'S' THEN 0 ELSE 1 END,
-                published_date DESC
+            ORDER BY rating DESC, published_date DESC  -- 'S' > 'A'
             """,
             (f"-{days} days",),
         )
         return [_row_to_content_item(row) for row in cursor.fetchall()]
 
 
-def mark_items_published(item_ids: list[int], digest_id: int) -> None:
-    """Mark items as published in a digest."""
-    with get_connection() as conn:
-        placeholders = ",".join("?" * len(item_ids))
-        conn.execute(
-            f"""
-            UPDATE content_items
-            SET published_to_obsidian = 1, digest_id = ?
-            WHERE id IN ({placeholders})
-            """,
-            [digest_id] + item_ids,
-        )
+def mark_items_published(
+    item_ids: list[int],
+    digest_id: int,
+    conn: sqlite3.Connection | None = None,
+) -> None:
+    """
+    Mark items as published in a digest.
+
+    Updates in batches of _IN_LIST_BATCH_SIZE ids, all in one transaction.
+    """
+    with _use_connection(conn) as conn:
+        for batch in _batched(item_ids, _IN_LIST_BATCH_SIZE):
+            placeholders = ",".join("?" * len(batch))
+            conn.execute(
+                f"""
+                UPDATE content_items
+                SET published_to_obsidian = 1, digest_id = ?
+                WHERE id IN ({placeholders})
+                """,
+                (digest_id, *batch),
+            )
+
+
+def _to_datetime(value: datetime | str | None) -> datetime | None:
+    """
+    Timestamp column value as a datetime.
+
+    Databases created before the columns were declared TIMESTAMP still
+    have TEXT columns, which sqlite3 returns as strings.
+    """
+    if isinstance(value, str):
+        return datetime.fromisoformat(value)
+    return value
 
 
 def _row_to_content_item(row: sqlite3.Row) -> ContentItem:
-    """Convert a database row to a ContentItem model."""
-    return ContentItem(
+    """
+    Convert a database row to a ContentItem model.
+
+    Rows are trusted (we wrote them), so this uses model_construct() to skip
+    Pydantic validation - every field must already have its final type.
+    """
+    return ContentItem.model_construct(
         id=row["id"],
         source_id=row["source_id"],
         title=row["title"],
         url=row["url"],
         description=row["description"],
         transcript=row["transcript"],
-        published_date=datetime.fromisoformat(row["published_date"])
-        if row["published_date"] else None,
+        published_date=_to_datetime(row["published_date"]),
         duration_minutes=row["duration_minutes"],
-        rating=Rating(row["rating"]) if row["rating"] else None,
+        rating=_RATINGS_BY_VALUE[row["rating"]] if row["rating"] else None,
         rating_reasoning=row["rating_reasoning"],
-        rated_at=datetime.fromisoformat(row["rated_at"])
-        if row["rated_at"] else None,
+        rated_at=_to_datetime(row["rated_at"]),
         published_to_obsidian=bool(row["published_to_obsidian"]),
         digest_id=row["digest_id"],
-        fetched_at=datetime.fromisoformat(row["fetched_at"])
-        if row["fetched_at"] else None,
+        fetched_at=_to_datetime(row["fetched_at"]),
     )
 
 
@@ -229,9 +392,9 @@ def _row_to_content_item(row: sqlite3.Row) -> ContentItem:
 # DIGEST OPERATIONS
 # ============================================
 
-def create_digest(digest: Digest) -> int:
+def create_digest(digest: Digest, conn: sqlite3.Connection | None = None) -> int:
     """Create a new digest record."""
-    with get_connection() as conn:
+    with _use_connection(conn) as conn:
         cursor = conn.execute(
             """
             INSERT INTO digests (
@@ -260,9 +423,10 @@ def log_fetch(
     items_fetched: int,
     success: bool,
     error_message: str | None = None,
+    conn: sqlite3.Connection | None = None,
 ) -> None:
     """Log a fetch attempt."""
-    with get_connection() as conn:
+    with _use_connection(conn) as conn:
         conn.execute(
             """
             INSERT INTO fetch_logs (
@@ -285,20 +449,27 @@ def log_fetch(
 # STATISTICS
 # ============================================
 
-def get_stats() -> dict:
+def get_stats(conn: sqlite3.Connection | None = None) -> dict:
     """Get database statistics."""
-    with get_connection() as conn:
+    with _use_connection(conn) as conn:
         stats = {}
 
-        # Total items
-        cursor = conn.execute("SELECT COUNT(*) FROM content_items")
-        stats["total_items"] = cursor.fetchone()[0]
-
-        # Rated items
+        # Totals in one scan via conditional aggregation
         cursor = conn.execute(
-            "SELECT COUNT(*) FROM content_items WHERE rating IS NOT NULL"
+            """
+            SELECT
+                COUNT(*) AS total_items,
+                COUNT(rating) AS rated_items,
+                COALESCE(SUM(
+                    rating IN ('A', 'S') AND published_to_obsidian = 0
+                ), 0) AS unpublished_top_tier
+            FROM content_items
+            """
         )
-        stats["rated_items"] = cursor.fetchone()[0]
+        row = cursor.fetchone()
+        stats["total_items"] = row["total_items"]
+        stats["rated_items"] = row["rated_items"]
+        stats["unpublished_top_tier"] = row["unpublished_top_tier"]
 
         # By rating
         cursor = conn.execute(
@@ -311,13 +482,4 @@ def get_stats() -> dict:
         )
         stats["by_rating"] = {row["rating"]: row["count"] for row in cursor.fetchall()}
 
-        # Unpublished A/S tier
-        cursor = conn.execute(
-            """
-            SELECT COUNT(*) FROM content_items
-            WHERE rating IN ('A', 'S') AND published_to_obsidian = 0
-            """
-        )
-        stats["unpublished_top_tier"] = cursor.fetchone()[0]
-
         return stats
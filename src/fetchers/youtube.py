@@ -3,22 +3,52 @@ YouTube content fetcher using yt-dlp.
 
 Fetches recent videos from YouTube channels, extracts metadata
 and transcripts (when available).
+
+Uses yt-dlp's Python API in-process: metadata comes back as info dicts
+and subtitles are read straight from their URL, so nothing is written
+to disk and no yt-dlp subprocess is spawned.
 """
 
-import json
-import subprocess
-import tempfile
+import click
+import codecs
+from collections.abc import Iterable, Iterator
 from datetime import datetime, timedelta
-from pathlib import Path
+
+from yt_dlp import YoutubeDL
+from yt_dlp.utils import DateRange, DownloadError
 
 from ..models import ContentItem
 from ..config import get_settings
 
 
+# Header lines in a VTT file that carry no transcript text
+_VTT_HEADER_PREFIXES = ("WEBVTT", "Kind:", "Language:")
+
+# Subtitle responses are read in chunks of this size
+_SUBTITLE_READ_SIZE = 65536
+
+
+def _ydl_options(verbose: bool = False, **overrides) -> dict:
+    """YoutubeDL options for metadata + English auto-subtitles, no downloads."""
+    options = {
+        "skip_download": True,          # Don't download video
+        "writeautomaticsub": True,      # Select auto-generated subtitles
+        "subtitleslangs": ["en"],       # English subtitles only
+        "subtitlesformat": "vtt",       # VTT format
+        "ignoreerrors": True,           # Continue on errors
+        "socket_timeout": 30,           # Per-request network timeout
+        "quiet": not verbose,
+        "no_warnings": not verbose,
+    }
+    options.update(overrides)
+    return options
+
+
 def fetch_channel_videos(
     channel_url: str,
     source_id: int,
     days_back: int | None = None,
+    verbose: bool = False,
 ) -> list[ContentItem]:
     """
     Fetch recent videos from a YouTube channel.
@@ -27,6 +57,7 @@ def fetch_channel_videos(
         channel_url: YouTube channel URL (e.g., https://www.youtube.com/@ThePrimeTimeagen)
         source_id: Database source ID for this channel
         days_back: How many days of videos to fetch (default from settings)
+        verbose: Echo per-video debug output to stderr
 
     Returns:
         List of ContentItem objects with video metadata
@@ -38,89 +69,82 @@ def fetch_channel_videos(
     # Calculate date filter
     date_after = (datetime.now() - timedelta(days=days_back)).strftime("%Y%m%d")
 
-    # Create temp directory for yt-dlp output
-    with tempfile.TemporaryDirectory() as tmpdir:
-        # yt-dlp command to fetch video metadata without downloading
-        cmd = [
-            "yt-dlp",
-            "--skip-download",           # Don't download video
-            "--write-info-json",         # Write metadata to JSON
-            "--write-auto-sub",          # Get auto-generated subtitles
-            "--sub-lang", "en",          # English subtitles only
-            "--sub-format", "vtt",       # VTT format
-            "--dateafter", date_after,   # Only videos after this date
-            "--playlist-end", "20",      # Max 20 videos per channel
-            "--ignore-errors",           # Continue on errors
-            "-o", f"{tmpdir}/%(id)s.%(ext)s",  # Output template
-            channel_url,
-        ]
-
-        print(f"Running yt-dlp for {channel_url}...")  # Debug
+    options = _ydl_options(
+        verbose,
+        daterange=DateRange(date_after),  # Only videos after this date
+        playlistend=20,                   # Max 20 videos per channel
+    )
+
+    if verbose:
+        click.echo(f"Running yt-dlp for {channel_url}...", err=True)
 
+    with YoutubeDL(options) as ydl:
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=120,  # 2 minute timeout
-            )
-
-            if result.returncode != 0:
-                print(f"yt-dlp error: {result.stderr}")
-                # Don't fail completely - we might get partial results
-
-        except subprocess.TimeoutExpired:
-            print(f"yt-dlp timed out for {channel_url}")
+            info = ydl.extract_info(channel_url, download=False)
+        except DownloadError as e:
+            click.echo(f"yt-dlp error: {e}", err=True)
+            return []
+
+        if not info:
+            click.echo(f"yt-dlp returned no results for {channel_url}", err=True)
             return []
 
-        # Parse the JSON files yt-dlp created
         items = []
-        tmpdir_path = Path(tmpdir)
+        videos = list(_iter_videos(info, date_after))
 
-        json_files = list(tmpdir_path.glob("*.info.json"))
-        print(f"Found {len(json_files)} JSON files")  # Debug
+        if verbose:
+            click.echo(f"Found {len(videos)} videos for {channel_url}", err=True)
 
-        for json_file in json_files:
+        for video in videos:
             try:
-                # Skip playlist metadata files (they have channel ID, not video ID)
-                if "[UC" in json_file.name and "Videos" in json_file.name:
-                    print(f"  Skipping playlist file: {json_file.name}")
-                    continue
-
-                item = _parse_video_json(json_file, source_id, settings)
+                item = _parse_video_info(video, source_id, settings, ydl)
                 if item:
                     items.append(item)
-                    print(f"  Parsed: {item.title[:50]}...")
+                    if verbose:
+                        click.echo(f"  Parsed: {item.title[:50]}...", err=True)
             except Exception as e:
-                print(f"Error parsing {json_file.name}: {e}")
+                click.echo(f"Error parsing video info: {e}", err=True)
                 continue
 
         return items
 
 
-def _parse_video_json(
-    json_path: Path,
+def _iter_videos(info: dict, date_after: str | None = None) -> Iterator[dict]:
+    """
+    Yield video info dicts from an extract_info() result.
+
+    Channel URLs come back as playlists of tab playlists (Videos, Shorts,
+    ...), so nested playlists are flattened. Failed entries are None.
+
+    Videos uploaded before date_after (YYYYMMDD) are skipped: yt-dlp
+    rejects them against the daterange option but still leaves them in
+    the playlist entries.
+    """
+    if info.get("_type") == "playlist":
+        for entry in info.get("entries") or []:
+            if entry:
+                yield from _iter_videos(entry, date_after)
+    elif date_after is None or (info.get("upload_date") or date_after) >= date_after:
+        # Videos without an upload date pass, as they do in yt-dlp's check
+        yield info
+
+
+def _parse_video_info(
+    data: dict,
     source_id: int,
     settings,
+    ydl: YoutubeDL,
 ) -> ContentItem | None:
-    """Parse a yt-dlp info.json file into a ContentItem."""
-    with open(json_path) as f:
-        data = json.load(f)
-
-    # Skip non-video content (playlists, etc.)
-    if data.get("_type") == "playlist":
-        return None
-
-    # Extract video ID for transcript lookup
+    """Build a ContentItem from one yt-dlp video info dict."""
     video_id = data.get("id")
     if not video_id:
         return None
 
-    # Try to load transcript from .vtt file
+    # Transcript comes from the selected English subtitle track, if any
     transcript = None
-    vtt_path = json_path.parent / f"{video_id}.en.vtt"
-    if vtt_path.exists():
-        transcript = _parse_vtt_transcript(vtt_path, settings.fetch.max_transcript_chars)
+    subtitle = (data.get("requested_subtitles") or {}).get("en")
+    if subtitle:
+        transcript = _fetch_transcript(ydl, subtitle, settings.fetch.max_transcript_chars)
 
     # Parse upload date
     upload_date = None
@@ -135,16 +159,61 @@ def _parse_video_json(
         source_id=source_id,
         title=data.get("title", "Unknown Title"),
         url=data.get("webpage_url") or f"https://www.youtube.com/watch?v={video_id}",
-        description=data.get("description", "")[:2000],  # Truncate long descriptions
+        description=(data.get("description") or "")[:2000],  # Truncate long descriptions
         transcript=transcript,
         published_date=upload_date,
         duration_minutes=int(data.get("duration", 0) // 60) if data.get("duration") else None,
     )
 
 
-def _parse_vtt_transcript(vtt_path: Path, max_chars: int) -> str:
+def _fetch_transcript(ydl: YoutubeDL, subtitle: dict, max_chars: int) -> str | None:
+    """
+    Parse a requested subtitle track.
+
+    The track is streamed, so once the parser has max_chars of text the
+    rest of a long video's subtitles is never downloaded. Returns None
+    when the track isn't VTT or can't be fetched; the video is still
+    kept, just without a transcript.
+    """
+    # yt-dlp falls back to json3/srv3 when there's no VTT track, which
+    # the VTT parser would store as markup
+    if subtitle.get("ext") != "vtt":
+        return None
+
+    # Some extractors inline the subtitle data instead of giving a URL
+    if subtitle.get("data") is not None:
+        return _parse_vtt_transcript(subtitle["data"].splitlines(), max_chars)
+
+    if not subtitle.get("url"):
+        return None
+
+    try:
+        with ydl.urlopen(subtitle["url"]) as response:
+            return _parse_vtt_transcript(_iter_response_lines(response), max_chars)
+    except Exception as e:
+        # e.g. HTTP 429 from the timedtext endpoint or a dropped connection
+        click.echo(f"Error fetching transcript: {e}", err=True)
+        return None
+
+
+def _iter_response_lines(response) -> Iterator[str]:
+    """Lazily yield decoded text lines from a binary HTTP response."""
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    pending = ""
+
+    while chunk := response.read(_SUBTITLE_READ_SIZE):
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        yield from lines
+
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending
+
+
+def _parse_vtt_transcript(lines: Iterable[str], max_chars: int) -> str:
     """
-    Parse a VTT subtitle file into plain text.
+    Parse VTT subtitle lines into plain text.
 
     VTT format has timing lines we need to skip:
     00:00:00.000 --> 00:00:02.000
@@ -153,37 +222,30 @@ def _parse_vtt_transcript(vtt_path: Path, max_chars: int) -> str:
     00:00:02.000 --> 00:00:04.000
     This is a test
     """
-    lines = []
-
-    with open(vtt_path) as f:
-        for line in f:
-            line = line.strip()
-            # Skip empty lines, timing lines, and WEBVTT header
-            if not line:
-                continue
-            if line.startswith("WEBVTT"):
-                continue
-            if "-->" in line:
-                continue
-            if line.startswith("Kind:") or line.startswith("Language:"):
-                continue
+    # Single pass: dedupe consecutive words (common in auto-captions) as
+    # they're read and stop once the text is longer than max_chars
+    words = []
+    prev_word = None
+    text_len = -1  # Length of " ".join(words)
 
-            # This is actual transcript text
-            lines.append(line)
+    for line in lines:
+        line = line.strip()
+        # Skip empty lines, timing lines, and WEBVTT header
+        # (one tuple startswith covers every header prefix)
+        if not line or "-->" in line or line.startswith(_VTT_HEADER_PREFIXES):
+            continue
 
-    # Join and truncate
-    full_text = " ".join(lines)
+        # This is actual transcript text
+        for word in line.split():
+            if word != prev_word:
+                words.append(word)
+                text_len += len(word) + 1
+            prev_word = word
 
-    # Remove duplicate consecutive words (common in auto-captions)
-    words = full_text.split()
-    cleaned_words = []
-    prev_word = None
-    for word in words:
-        if word != prev_word:
-            cleaned_words.append(word)
-        prev_word = word
+        if text_len > max_chars:
+            break
 
-    cleaned_text = " ".join(cleaned_words)
+    cleaned_text = " ".join(words)
 
     if len(cleaned_text) > max_chars:
         cleaned_text = cleaned_text[:max_chars] + "..."
@@ -199,28 +261,13 @@ def fetch_single_video(video_url: str, source_id: int) -> ContentItem | None:
     """
     settings = get_settings()
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        cmd = [
-            "yt-dlp",
-            "--skip-download",
-            "--write-info-json",
-            "--write-auto-sub",
-            "--sub-lang", "en",
-            "--sub-format", "vtt",
-            "--no-warnings",
-            "--quiet",
-            "-o", f"{tmpdir}/%(id)s.%(ext)s",
-            video_url,
-        ]
-
+    with YoutubeDL(_ydl_options(noplaylist=True)) as ydl:
         try:
-            subprocess.run(cmd, capture_output=True, timeout=60)
-        except subprocess.TimeoutExpired:
+            info = ydl.extract_info(video_url, download=False)
+        except DownloadError:
             return None
 
-        # Find the JSON file
-        json_files = list(Path(tmpdir).glob("*.info.json"))
-        if not json_files:
+        if not info:
             return None
 
-        return _parse_video_json(json_files[0], source_id, settings)
+        return _parse_video_info(info, source_id, settings, ydl)
@@ -2,68 +2,600 @@
 Fabric integration for content rating.
 
 Calls the Fabric CLI to rate content using the rate_content pattern.
+Batches can instead go straight to the model's HTTP API (HttpBackend).
 """
 
+import asyncio
+import functools
+import hashlib
+import os
+import shutil
 import subprocess
 import re
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from cachetools import LFUCache
+
+# RE2 matches in linear time on any input; use it for parsing Fabric
+# output when google-re2 is installed
+try:
+    import re2 as re_engine
+except ImportError:
+    import re as re_engine
+
 from ..models import ContentItem, RatingResult, Rating
 from ..config import get_settings
 
 
-def rate_content_item(item: ContentItem) -> RatingResult:
+# Seconds to wait for a single Fabric call
+FABRIC_TIMEOUT = 60
+
+# Patterns for parsing rate_content output, compiled once at import.
+# Output is parsed as bytes; only the reasoning text is ever decoded.
+# Groups are positional (1: "X Tier:", 2: "RATING: X") because google-re2
+# keys a bytes pattern's group names by bytes, so group("name") fails
+_RATING_LETTER_RE = re_engine.compile(rb"([SABCD])\s+Tier:|RATING:\s*([SABCD])")
+_TIER_DESCRIPTION_RE = re_engine.compile(rb"[SABCD] Tier:\s*\(([^)]+)\)")
+
+# Matched rating letter (bytes) -> Rating, so parsing skips enum coercion
+_RATINGS_BY_LETTER = {rating.value.encode(): rating for rating in Rating}
+
+# The rating is near the top of Fabric's output; search this many
+# characters first and only scan the whole output on a miss
+_PARSE_HEAD_CHARS = 2048
+
+# Lines searched for the rating while streaming: enough for "RATING:",
+# a blank line and the letter
+_RATING_WINDOW_LINES = 3
+
+# Section markers around the explanation
+_EXPLANATION_MARKER = b"Explanation:"
+_CONTENT_SCORE_MARKER = b"CONTENT SCORE:"
+
+# Called with each (item, result_or_exception) as soon as it's rated
+_ResultCallback = Callable[[ContentItem, "RatingResult | Exception"], None]
+
+# Ratings already produced this run, keyed by a hash of the Fabric input,
+# so identical items (e.g. re-crawled duplicates) are only rated once
+_rating_cache: LFUCache = LFUCache(maxsize=1024)
+_rating_cache_lock = threading.Lock()
+
+
+def rate_content_item(
+    item: ContentItem,
+    worker: "FabricWorker | None" = None,
+    limiter: "_RateLimiter | None" = None,
+) -> RatingResult:
     """
     Rate a content item using Fabric's rate_content pattern.
 
+    Fabric's stdout is read as it streams; once the rating and its
+    explanation are in, the process is stopped instead of waiting for
+    the rest of the output. An input already rated by this process is
+    answered from the rating cache.
+
     Args:
         item: The content item to rate
+        worker: Optional FabricWorker supplying a pre-spawned Fabric process
+        limiter: Optional rate limiter shared by concurrent callers
 
     Returns:
         RatingResult with rating (S/A/B/C/D) and reasoning
 
     Raises:
-        ValueError: If rating cannot be parsed from Fabric output
-        subprocess.TimeoutExpired: If Fabric takes too long
+        ValueError: If Fabric fails, times out, or its output can't be parsed
+    """
+    input_text = _build_input_text(item)
+    prefiltered = _prefilter_rating(item)
+    if prefiltered is not None:
+        return prefiltered
+
+    cache_key = _rating_cache_key(input_text)
+    cached = _get_cached_rating(cache_key)
+    if cached is not None:
+        return cached
+
+    # A worker's spare process keeps warming up during the wait
+    if limiter is not None:
+        limiter.acquire()
+
+    proc = worker.take() if worker is not None else _spawn_fabric(_fabric_command())
+
+    result = parse_rating_output(_read_rating_output(proc, input_text))
+    _cache_rating(cache_key, result)
+    return result
+
+
+def _read_rating_output(proc: subprocess.Popen, input_text: str) -> bytes:
+    """
+    Send input_text to a Fabric process and collect its output.
+
+    Stops reading (and terminates Fabric) at the "CONTENT SCORE:" line
+    that follows the rating, since nothing after it is parsed. A watchdog
+    timer enforces FABRIC_TIMEOUT, and stderr is drained on a thread so
+    a chatty Fabric can't block on a full pipe.
+    """
+    timed_out = threading.Event()
+
+    def kill_on_timeout():
+        timed_out.set()
+        proc.kill()
+
+    stderr_chunks = []
+    stderr_reader = threading.Thread(
+        target=lambda: stderr_chunks.append(proc.stderr.read()), daemon=True
+    )
+    watchdog = threading.Timer(FABRIC_TIMEOUT, kill_on_timeout)
+    stderr_reader.start()
+    watchdog.start()
+
+    lines = []
+    rated = False
+    stopped_early = False
+
+    try:
+        try:
+            proc.stdin.write(input_text.encode())
+            proc.stdin.close()
+        except BrokenPipeError:
+            pass  # Fabric exited before reading its input - stderr says why
+
+        for line in proc.stdout:
+            lines.append(line)
+
+            if not rated:
+                # "RATING:" and its letter may be a blank line apart, so
+                # only the last few lines need searching
+                recent = b"".join(lines[-_RATING_WINDOW_LINES:])
+                rated = _RATING_LETTER_RE.search(recent) is not None
+            elif _CONTENT_SCORE_MARKER in line:
+                stopped_early = True
+                break
+    finally:
+        watchdog.cancel()
+        if stopped_early or timed_out.is_set():
+            proc.kill()
+        proc.wait()
+        proc.stdout.close()
+        stderr_reader.join()
+        proc.stderr.close()
+
+    if timed_out.is_set():
+        raise ValueError("Fabric rating timed out")
+
+    if not stopped_early and proc.returncode != 0:
+        stderr = b"".join(stderr_chunks).decode(errors="replace")
+        raise ValueError(f"Fabric error: {stderr}")
+
+    return b"".join(lines)
+
+
+class FabricWorker:
+    """
+    Keeps Fabric processes pre-spawned and waiting on stdin.
+
+    Fabric has no server or multi-record stdin mode: each process reads
+    its input to EOF, rates it and exits, so a single process can't be
+    reused. Instead, whenever a process is handed out a replacement is
+    spawned straight away, so its fork/exec and startup overlap the
+    current call rather than adding to the next one.
+
+    Thread-safe: with spares=N, N concurrent callers each find a warm
+    process waiting. Warm-up spawns are best effort: if one fails (e.g.
+    fabric isn't installed) take() spawns on demand, so the error is
+    raised per item by rate_content_item.
+
+    Usage:
+        with FabricWorker() as worker:
+            for item in items:
+                result = rate_content_item(item, worker=worker)
+    """
+
+    def __init__(self, spares: int = 1):
+        self._cmd = _fabric_command()
+        self._spare_count = max(1, spares)
+        self._spares: list[subprocess.Popen] = []
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "FabricWorker":
+        for _ in range(self._spare_count):
+            proc = self._try_spawn()
+            if proc is None:
+                break
+            self._spares.append(proc)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        with self._lock:
+            spares, self._spares = self._spares, []
+
+        for proc in spares:
+            proc.kill()
+            proc.communicate()
+
+    def take(self) -> subprocess.Popen:
+        """Return a ready Fabric process and start warming up a replacement."""
+        with self._lock:
+            proc = self._spares.pop() if self._spares else None
+
+        # Spawned outside the lock so concurrent takes don't queue on it
+        if proc is None:
+            proc = _spawn_fabric(self._cmd)
+
+        try:
+            replacement = self._try_spawn()
+        except BaseException:
+            # Don't leak the process we were about to hand out
+            proc.kill()
+            proc.communicate()
+            raise
+
+        if replacement is not None:
+            with self._lock:
+                self._spares.append(replacement)
+        return proc
+
+    def _try_spawn(self) -> subprocess.Popen | None:
+        """Spawn a spare, or return None if Fabric can't be started."""
+        try:
+            return _spawn_fabric(self._cmd)
+        except OSError:
+            return None
+
+
+def _spawn_fabric(cmd: list[str]) -> subprocess.Popen:
+    """
+    Start a Fabric process that waits for its input on stdin.
+
+    The arguments are chosen so CPython launches the child with
+    os.posix_spawn instead of fork + exec: cmd[0] is an absolute path
+    (see _fabric_command) and close_fds=False is safe because Python
+    creates its pipes non-inheritable. Passing preexec_fn, cwd,
+    start_new_session, user/group or pass_fds, or leaving close_fds at
+    its default, silently falls back to the slower path.
+    """
+    return subprocess.Popen(
+        cmd,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        close_fds=False,
+    )
+
+
+async def rate_content_item_async(
+    item: ContentItem,
+    limiter: "_AsyncRateLimiter | None" = None,
+    backend: "FabricBackend | None" = None,
+) -> RatingResult:
+    """
+    Async version of rate_content_item.
+
+    Many items can be rated concurrently from one thread. The backend
+    does the actual model call; by default the Fabric CLI is run via
+    asyncio's subprocess support. Shares the rating cache with
+    rate_content_item.
+
+    Args:
+        item: The content item to rate
+        limiter: Optional rate limiter shared by concurrent calls
+        backend: Transport to the rating model (default: SubprocessBackend)
+
+    Raises:
+        ValueError: If Fabric fails, times out, or its output can't be parsed
+    """
+    prefiltered = _prefilter_rating(item)
+    if prefiltered is not None:
+        return prefiltered
+
+    input_text = _build_input_text(item)
+    cache_key = _rating_cache_key(input_text)
+    cached = _get_cached_rating(cache_key)
+    if cached is not None:
+        return cached
+
+    if backend is None:
+        backend = SubprocessBackend()
+
+    result = parse_rating_output(await backend.complete(input_text, limiter))
+    _cache_rating(cache_key, result)
+    return result
+
+
+# =============================================================================
+# Backends
+# =============================================================================
+
+
+class FabricBackend(ABC):
+    """
+    Transport that sends Fabric input text to the rating model.
+
+    Implementations return the model's raw rate_content output as bytes,
+    which is parsed by parse_rating_output. Use as an async context manager (or
+    call aclose) so network resources are released.
+    """
+
+    @abstractmethod
+    async def complete(
+        self,
+        input_text: str,
+        limiter: "_AsyncRateLimiter | None" = None,
+    ) -> bytes:
+        """
+        Run the rate_content pattern on input_text.
+
+        Raises:
+            ValueError: If the call fails or times out
+        """
+
+    async def aclose(self) -> None:
+        """Release any resources held by the backend."""
+
+    async def __aenter__(self) -> "FabricBackend":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+
+class SubprocessBackend(FabricBackend):
+    """
+    Runs the Fabric CLI once per call.
+
+    The process is spawned before waiting on limiter, so Fabric's startup
+    overlaps the rate-limit wait.
     """
-    settings = get_settings()
 
-    # Build input text: title + description + transcript (truncated)
-    input_parts = [f"Title: {item.title}"]
+    async def complete(
+        self,
+        input_text: str,
+        limiter: "_AsyncRateLimiter | None" = None,
+    ) -> bytes:
+        proc = await asyncio.create_subprocess_exec(
+            *_fabric_command(),
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            close_fds=False,  # Keeps the posix_spawn path, see _spawn_fabric
+        )
+
+        try:
+            if limiter is not None:
+                await limiter.acquire()
+
+            stdout, stderr = await asyncio.wait_for(
+                proc.communicate(input_text.encode()),
+                timeout=FABRIC_TIMEOUT,
+            )
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise ValueError("Fabric rating timed out")
+        except BaseException:
+            # Cancelled while waiting - don't leave the process behind
+            if proc.returncode is None:
+                proc.kill()
+                await proc.wait()
+            raise
+
+        if proc.returncode != 0:
+            raise ValueError(f"Fabric error: {stderr.decode(errors='replace')}")
+
+        return stdout
+
+
+class HttpBackend(FabricBackend):
+    """
+    Calls an OpenAI-compatible chat completions API directly.
+
+    Skips the Fabric CLI entirely: the pattern's system prompt is read
+    once from Fabric's pattern directory and every call is a POST on a
+    shared HTTP/2 client, so connections (and TLS sessions) are reused
+    across the batch.
+    """
+
+    def __init__(
+        self,
+        api_base: str,
+        api_key: str | None,
+        model: str,
+        system_prompt: str,
+        max_connections: int = 5,
+    ):
+        # Only needed for this backend
+        import httpx
+
+        self._httpx = httpx
+        self._model = model
+        self._system_prompt = system_prompt
+
+        headers = {"Authorization": f"Bearer {api_key}"} if api_key else {}
+        self._client = httpx.AsyncClient(
+            base_url=api_base,
+            headers=headers,
+            http2=True,
+            timeout=FABRIC_TIMEOUT,
+            limits=httpx.Limits(max_connections=max_connections),
+        )
+
+    @classmethod
+    def from_settings(cls, max_connections: int = 5) -> "HttpBackend":
+        """Build a backend from the fabric section of settings.yaml."""
+        fabric = get_settings().fabric
+        return cls(
+            api_base=fabric.api_base,
+            api_key=os.environ.get(fabric.api_key_env),
+            model=fabric.model,
+            system_prompt=_load_pattern_prompt(fabric.patterns_dir, fabric.pattern),
+            max_connections=max_connections,
+        )
 
+    async def complete(
+        self,
+        input_text: str,
+        limiter: "_AsyncRateLimiter | None" = None,
+    ) -> bytes:
+        if limiter is not None:
+            await limiter.acquire()
+
+        payload = {
+            "model": self._model,
+            "messages": [
+                {"role": "system", "content": self._system_prompt},
+                {"role": "user", "content": input_text},
+            ],
+        }
+
+        try:
+            response = await self._client.post("/chat/completions", json=payload)
+            response.raise_for_status()
+            content = response.json()["choices"][0]["message"]["content"]
+        except self._httpx.TimeoutException:
+            raise ValueError("Fabric rating timed out")
+        except (self._httpx.HTTPError, KeyError, IndexError, TypeError, ValueError) as e:
+            raise ValueError(f"Fabric error: {e}")
+
+        # Refusals and tool-call replies carry no text content
+        if not content:
+            raise ValueError("Fabric error: model returned no content")
+
+        return content.encode()
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+
+def _load_pattern_prompt(patterns_dir: str, pattern: str) -> str:
+    """Read a Fabric pattern's system prompt (<patterns_dir>/<pattern>/system.md)."""
+    path = Path(patterns_dir).expanduser() / pattern / "system.md"
+    try:
+        return path.read_text()
+    except OSError as e:
+        raise ValueError(f"Could not read Fabric pattern {pattern!r}: {e}")
+
+
+def _backend_from_settings(max_connections: int = 5) -> FabricBackend:
+    """Create the backend selected by fabric.backend in settings.yaml."""
+    name = get_settings().fabric.backend
+
+    if name == "subprocess":
+        return SubprocessBackend()
+    if name == "http":
+        return HttpBackend.from_settings(max_connections)
+
+    raise ValueError(f"Unknown fabric.backend {name!r} (expected 'subprocess' or 'http')")
+
+
+def _build_input_text(item: ContentItem) -> str:
+    """Build Fabric input: title + description (truncated) + transcript."""
+    description = ""
     if item.description:
-        input_parts.append(f"Description: {item.description[:500]}")
+        description = item.description
+        # Only slice descriptions that actually need truncating
+        if len(description) > 500:
+            description = description[:500]
+        description = f"\n\nDescription: {description}"
+
+    transcript = f"\n\nTranscript: {item.transcript}" if item.transcript else ""
+
+    # One f-string instead of building and joining a parts list
+    return f"Title: {item.title}{description}{transcript}"
+
+
+def _prefilter_rating(item: ContentItem) -> RatingResult | None:
+    """
+    Rate an item from fabric.prefilter title keywords, skipping Fabric.
+
+    Returns None (rate with Fabric) when no keyword matches, or when the
+    matching keywords disagree on the rating.
+    """
+    prefilter = _compile_prefilter()
+    if prefilter is None:
+        return None
 
-    if item.transcript:
-        input_parts.append(f"Transcript: {item.transcript}")
+    pattern, ratings = prefilter
+    matches = {match.group().lower() for match in pattern.finditer(item.title)}
+    if not matches or len({ratings[keyword] for keyword in matches}) > 1:
+        return None
 
-    input_text = "\n\n".join(input_parts)
+    keyword = min(matches)
+    return RatingResult(
+        rating=ratings[keyword],
+        reasoning=f"prefilter: title matches {keyword!r}",
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _compile_prefilter() -> tuple[re.Pattern, dict[str, Rating]] | None:
+    """
+    Compile fabric.prefilter into one case-insensitive alternation.
+
+    Returns the pattern and a lowercase keyword -> Rating map, or None
+    when no keywords are configured.
+    """
+    ratings = {}
+    for rating, keywords in get_settings().fabric.prefilter.items():
+        for keyword in keywords:
+            ratings[keyword.lower()] = Rating(rating)
+
+    if not ratings:
+        return None
+
+    # Stays on re: RE2 has no lookbehind
+    # Whole words only; longest first, so a keyword isn't shadowed by a
+    # shorter one inside it
+    keywords = sorted(ratings, key=len, reverse=True)
+    alternation = "|".join(map(re.escape, keywords))
+    pattern = re.compile(rf"(?<!\w)(?:{alternation})(?!\w)", re.IGNORECASE)
+    return pattern, ratings
+
+
+def _rating_cache_key(input_text: str) -> bytes:
+    """Cache key for a Fabric input: its 128-bit BLAKE2b digest."""
+    return hashlib.blake2b(input_text.encode(), digest_size=16).digest()
 
-    # Call Fabric CLI
-    cmd = [
-        "fabric",
+
+def _get_cached_rating(cache_key: bytes) -> RatingResult | None:
+    """Return the cached rating for cache_key, if any."""
+    # LFUCache updates use counts on every read, so reads need the lock too
+    with _rating_cache_lock:
+        return _rating_cache.get(cache_key)
+
+
+def _cache_rating(cache_key: bytes, result: RatingResult) -> None:
+    """Remember a rating, evicting the least frequently used one when full."""
+    with _rating_cache_lock:
+        _rating_cache[cache_key] = result
+
+
+def _fabric_command() -> list[str]:
+    """Fabric CLI invocation for the configured pattern and model."""
+    settings = get_settings()
+    return [
+        _fabric_executable(),
         "--pattern", settings.fabric.pattern,
         "--model", settings.fabric.model,
     ]
 
-    try:
-        result = subprocess.run(
-            cmd,
-            input=input_text,
-            capture_output=True,
-            text=True,
-            timeout=60,  # 1 minute timeout
-        )
 
-        if result.returncode != 0:
-            raise ValueError(f"Fabric error: {result.stderr}")
-
-        output = result.stdout
-        return parse_rating_output(output)
+@functools.lru_cache(maxsize=1)
+def _fabric_executable() -> str:
+    """
+    Absolute path of the fabric binary, resolved once.
 
-    except subprocess.TimeoutExpired:
-        raise ValueError("Fabric rating timed out")
+    subprocess only uses posix_spawn when the executable has a directory
+    part; if fabric isn't on PATH the bare name is used so the error
+    still comes from Popen.
+    """
+    return shutil.which("fabric") or "fabric"
 
 
-def parse_rating_output(output: str) -> RatingResult:
+def parse_rating_output(output: bytes) -> RatingResult:
     """
     Parse Fabric rate_content output to extract rating and reasoning.
 
@@ -75,65 +607,231 @@ def parse_rating_output(output: str) -> RatingResult:
     Explanation:
     - ...
     - ...
-    """
-    # Extract the rating letter (S, A, B, C, or D)
-    rating_match = re.search(r"([SABCD])\s+Tier:", output)
 
-    if not rating_match:
-        # Try alternate format
-        rating_match = re.search(r"RATING:\s*([SABCD])", output)
+    The output is searched as raw bytes; only the extracted reasoning is
+    decoded (as UTF-8).
+    """
+    # Extract the rating letter (S, A, B, C, or D) - "X Tier:" or the
+    # alternate "RATING: X" format, in a single scan
+    head = output[:_PARSE_HEAD_CHARS]
+    rating_match = _RATING_LETTER_RE.search(head) or _RATING_LETTER_RE.search(output)
 
     if not rating_match:
-        raise ValueError(f"Could not parse rating from output: {output[:200]}...")
-
-    rating_letter = rating_match.group(1)
+        preview = output[:200].decode(errors="replace")
+        raise ValueError(f"Could not parse rating from output: {preview}...")
 
-    # Extract explanation/reasoning
-    explanation_match = re.search(
-        r"Explanation:\s*(.*?)(?:CONTENT SCORE:|$)",
-        output,
-        re.DOTALL
-    )
-
-    if explanation_match:
-        reasoning = explanation_match.group(1).strip()
-        # Clean up bullet points
-        reasoning = re.sub(r"^- ", "", reasoning, flags=re.MULTILINE)
-        reasoning = reasoning.replace("\n- ", " ")
+    rating_letter = rating_match.group(1) or rating_match.group(2)
+    try:
+        rating = _RATINGS_BY_LETTER[rating_letter]
+    except KeyError:
+        # Unreachable while the regexes only match [SABCD]
+        raise ValueError(f"Unknown rating {rating_letter!r} in Fabric output")
+
+    # Extract explanation/reasoning: the text between "Explanation:" and
+    # "CONTENT SCORE:" (or the end), found with plain bytes.find
+    start = output.find(_EXPLANATION_MARKER)
+
+    if start != -1:
+        start += len(_EXPLANATION_MARKER)
+        end = output.find(_CONTENT_SCORE_MARKER, start)
+        explanation = output[start:end if end != -1 else None].decode(errors="replace")
+
+        # Clean up bullet points: one line per bullet -> one paragraph
+        lines = (
+            (line[2:] if line.startswith("- ") else line).strip()
+            for line in explanation.splitlines()
+        )
+        reasoning = " ".join(line for line in lines if line)
     else:
         # Fallback: use the tier description
-        tier_match = re.search(r"[SABCD] Tier:\s*\(([^)]+)\)", output)
-        reasoning = tier_match.group(1) if tier_match else "No explanation provided"
+        tier_match = _TIER_DESCRIPTION_RE.search(head) or _TIER_DESCRIPTION_RE.search(output)
+        reasoning = (
+            tier_match.group(1).decode(errors="replace")
+            if tier_match
+            else "No explanation provided"
+        )
 
     return RatingResult(
-        rating=Rating(rating_letter),
+        rating=rating,
         reasoning=reasoning[:500],  # Truncate to reasonable length
     )
 
 
-def rate_batch(items: list[ContentItem], delay_seconds: float = 2.0) -> list[tuple[ContentItem, RatingResult | Exception]]:
+def rate_batch(
+    items: list[ContentItem],
+    delay_seconds: float = 2.0,
+    max_concurrent: int | None = None,
+    backend: FabricBackend | None = None,
+    on_result: _ResultCallback | None = None,
+) -> list[tuple[ContentItem, RatingResult | Exception]]:
     """
-    Rate multiple items with delay between calls.
+    Rate multiple items concurrently with rate limiting.
+
+    With the default subprocess backend, items are rated on a thread pool
+    (threads wait on Fabric with the GIL released); otherwise this runs
+    rate_batch_async on a fresh event loop.
 
     Args:
         items: List of content items to rate
-        delay_seconds: Delay between API calls (for rate limiting)
+        delay_seconds: Minimum delay between starting API calls (for rate limiting)
+        max_concurrent: Max Fabric calls in flight (default: fabric.batch_size)
+        backend: Transport to the rating model (default: fabric.backend).
+            A backend passed here is closed when the batch ends: each call
+            runs on a fresh event loop, which an HttpBackend's client can't
+            outlive. Reuse a backend across batches via rate_batch_async.
+        on_result: Called on this thread with (item, result_or_exception)
+            as each item finishes, so callers can save results as they go
 
     Returns:
-        List of (item, result_or_exception) tuples
+        List of (item, result_or_exception) tuples, in input order
     """
-    import time
+    if max_concurrent is None:
+        max_concurrent = get_settings().fabric.batch_size
+
+    rate_per_sec = 1.0 / delay_seconds if delay_seconds > 0 else None
+
+    if backend is None and get_settings().fabric.backend == "subprocess":
+        return _rate_batch_threaded(items, max_concurrent, rate_per_sec, on_result)
 
-    results = []
-    for i, item in enumerate(items):
+    async def run_batch():
         try:
-            result = rate_content_item(item)
-            results.append((item, result))
-        except Exception as e:
-            results.append((item, e))
+            return await rate_batch_async(
+                items, max_concurrent, rate_per_sec, backend, on_result
+            )
+        finally:
+            if backend is not None:
+                await backend.aclose()
+
+    return asyncio.run(run_batch())
+
+
+def _rate_batch_threaded(
+    items: list[ContentItem],
+    max_concurrent: int,
+    rate_per_sec: float | None,
+    on_result: _ResultCallback | None = None,
+) -> list[tuple[ContentItem, RatingResult | Exception]]:
+    """Rate items with rate_content_item on max_concurrent threads."""
+    if not items:
+        return []
+
+    limiter = _RateLimiter(rate_per_sec) if rate_per_sec else None
+
+    # Filled by index as calls finish, so the output keeps input order
+    results: list[tuple[ContentItem, RatingResult | Exception]] = [None] * len(items)  # type: ignore[list-item]
+
+    # One warm Fabric process per thread. The worker outlives the pool, so
+    # no thread takes a process after the spares are killed
+    with FabricWorker(spares=min(max_concurrent, len(items))) as worker:
+        with ThreadPoolExecutor(max_workers=max(1, max_concurrent)) as executor:
+            futures = {
+                executor.submit(rate_content_item, item, worker=worker, limiter=limiter): index
+                for index, item in enumerate(items)
+            }
+
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    result = e
+                results[index] = (items[index], result)
+                if on_result is not None:
+                    on_result(items[index], result)
+
+    return results
 
-        # Delay between calls (except for last item)
-        if i < len(items) - 1:
-            time.sleep(delay_seconds)
+
+async def rate_batch_async(
+    items: list[ContentItem],
+    max_concurrent: int = 5,
+    rate_per_sec: float | None = None,
+    backend: FabricBackend | None = None,
+    on_result: _ResultCallback | None = None,
+) -> list[tuple[ContentItem, RatingResult | Exception]]:
+    """
+    Rate multiple items concurrently.
+
+    Args:
+        items: List of content items to rate
+        max_concurrent: Max Fabric calls in flight at once
+        rate_per_sec: Max Fabric calls started per second across all
+            workers (None for no limit)
+        backend: Transport to the rating model. If None, the one selected
+            by fabric.backend is created and closed after the batch. A
+            caller-supplied backend is left open, for reuse by further
+            batches on the same event loop.
+        on_result: Called with (item, result_or_exception) as each item
+            finishes, so callers can save results as they go
+
+    Returns:
+        List of (item, result_or_exception) tuples, in input order
+    """
+    semaphore = asyncio.Semaphore(max_concurrent)
+    limiter = _AsyncRateLimiter(rate_per_sec) if rate_per_sec else None
+
+    # A caller-supplied backend stays open for reuse across batches on
+    # this event loop
+    owns_backend = backend is None
+    if owns_backend:
+        backend = _backend_from_settings(max_connections=max_concurrent)
+
+    # Filled by index as items finish, so the output keeps input order
+    results: list[tuple[ContentItem, RatingResult | Exception]] = [None] * len(items)  # type: ignore[list-item]
+
+    async def rate_one(index: int, item: ContentItem) -> None:
+        async with semaphore:
+            try:
+                result = await rate_content_item_async(item, limiter, backend)
+            except Exception as e:
+                result = e
+
+        results[index] = (item, result)
+        if on_result is not None:
+            on_result(item, result)
+
+    try:
+        await asyncio.gather(*(rate_one(index, item) for index, item in enumerate(items)))
+    finally:
+        if owns_backend:
+            await backend.aclose()
 
     return results
+
+
+class _RateLimiter:
+    """
+    Token bucket (capacity 1) shared by concurrent workers.
+
+    Call starts are spaced at least 1 / rate_per_sec seconds apart,
+    measured from when the slot was granted rather than when the previous
+    call finished, so calls slower than the interval never wait.
+    Thread-safe.
+    """
+
+    def __init__(self, rate_per_sec: float):
+        self._interval = 1.0 / rate_per_sec
+        self._next_allowed = 0.0
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Claim the next slot and return how long to wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_allowed - now
+            self._next_allowed = max(self._next_allowed, now) + self._interval
+        return wait
+
+    def acquire(self) -> None:
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+
+class _AsyncRateLimiter(_RateLimiter):
+    """_RateLimiter for asyncio tasks: waits with asyncio.sleep."""
+
+    async def acquire(self) -> None:
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)